@@ -72,6 +72,9 @@ class Timecode:
         fps (float): Frames per second rate
     """
 
+    # Regex pattern for HH:MM:SS:FF (semicolons normalized before matching)
+    TIMECODE_PATTERN = re.compile(r'(\d{1,2}):(\d{1,2}):(\d{1,2}):(\d{1,2})')
+
     def __init__(self, timecode_str: str, fps: float = 23.976) -> None:
         """
         Initialize timecode from string representation.
@@ -105,7 +108,7 @@ class Timecode:
         tc_str = tc_str.replace(';', ':')
 
         # Match timecode pattern
-        match = re.match(r'(\d{1,2}):(\d{1,2}):(\d{1,2}):(\d{1,2})', tc_str)
+        match = self.TIMECODE_PATTERN.match(tc_str)
         if not match:
             raise TimecodeError(f"Invalid timecode format: {tc_str}")
 
@@ -142,7 +142,7 @@ class FileRenamer:
                 rename_map[str(master_name)] = str(proxy_names[index])
 
         print(f'Examining {len(target_files)} files...')
-        self.logger.info(f'Examining {len(target_files)} files...')
+        self.logger.info('Examining %d files...', len(target_files))
 
         # Process each file
         for file_path in target_files:
@@ -161,22 +161,22 @@ class FileRenamer:
                             backup_path = new_path.with_name(f"{new_path.stem}_backup_{datetime.now().strftime('%Y%m%d%H%M%S')}{new_path.suffix}")
                             shutil.copy2(new_path, backup_path)
                             print(f"Backed up existing file to: {backup_path}")
-                            self.logger.info(f"Backed up existing file: {new_path} -> {backup_path}")
+                            self.logger.info("Backed up existing file: %s -> %s", new_path, backup_path)
                         else:
                             print(f"Skipping {file_path} - destination already exists: {new_path}")
-                            self.logger.warning(f"Skipping rename - destination exists: {new_path}")
+                            self.logger.warning("Skipping rename - destination exists: %s", new_path)
                             result.skipped_count += 1
                             continue
 
                     # Perform rename or simulate it
                     if self.config.dry_run:
                         print(f"Would rename: {file_path.name} -> {new_name}")
-                        self.logger.info(f"Dry run: would rename {file_path} -> {new_path}")
+                        self.logger.info("Dry run: would rename %s -> %s", file_path, new_path)
                         result.renamed_count += 1
                     else:
                         file_path.rename(new_path)
                         print(f"Renamed: {file_path.name} -> {new_path.name}")
-                        self.logger.info(f"Renamed: {file_path} -> {new_path}")
+                        self.logger.info("Renamed: %s -> %s", file_path, new_path)
                         result.renamed_count += 1
 
                 except Exception as e:
@@ -227,6 +227,7 @@ def setup_logger(logname='renames.log'):
     logging.basicConfig(
         filename=log_file_path,
         filemode='a',
+        encoding='utf-8',
         format='%(asctime)s,%(msecs)d %(name)s %(levelname)s %(message)s',
         datefmt="%Y-%m-%d %H:%M:%S",
         level=logging.DEBUG
@@ -354,7 +355,7 @@ def main():
         try:
             df = pd.read_excel(excel_file, sheet_name=0)  # Always use first sheet
             print(f"Successfully read Excel file with {len(df)} rows from sheet '{sheet_name}'")
-            logger.info(f"Successfully read Excel file with {len(df)} rows from sheet '{sheet_name}'")
+            logger.info("Successfully read Excel file with %d rows from sheet '%s'", len(df), sheet_name)
         except Exception as e:
             error_msg = f"Error reading Excel file: {str(e)}"
             print(error_msg)
@@ -454,7 +454,7 @@ class FileRenamerApp(QMainWindow):
 
                 df = pd.read_excel(excel_file, sheet_name=0)  # Always use first sheet
                 print(f"Successfully read Excel file with {len(df)} rows from sheet '{sheet_name}'")
-                self.logger.info(f"Successfully read Excel file with {len(df)} rows from sheet '{sheet_name}'")
+                self.logger.info("Successfully read Excel file with %d rows from sheet '%s'", len(df), sheet_name)
             except Exception as e:
                 print(f"Error reading Excel file: {str(e)}")
                 self.logger.error(f"Error reading Excel file: {str(e)}")